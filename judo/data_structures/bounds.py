@@ -10,6 +10,23 @@ from judo.judo_tensor import tensor
 from judo.typing import Scalar, Tensor
 
 
+# Importing numba is slow, so the kernels are imported the first time they can be used.
+# NUMBA_AVAILABLE is None until then.
+NUMBA_AVAILABLE = None
+numba_kernels = None
+
+
+def _load_numba_kernels() -> bool:
+    """Import the numba kernels if needed and return True if numba is installed."""
+    global NUMBA_AVAILABLE, numba_kernels
+    if NUMBA_AVAILABLE is None:
+        from judo.functions import numba_kernels as kernels
+
+        numba_kernels = kernels
+        NUMBA_AVAILABLE = kernels.NUMBA_AVAILABLE
+    return NUMBA_AVAILABLE
+
+
 class Bounds:
     """
     The :class:`Bounds` implements the logic for defining and managing closed intervals, \
@@ -67,14 +84,36 @@ class Bounds:
             shape = low.shape
         elif shape is None:
             raise TypeError("If shape is None high or low need to have .shape attribute.")
-        # High and low will be arrays of target shape
+        # High and low will be arrays of target shape. Scalars are filled as floats so
+        # the default dtype is the backend's floating point type.
         if not judo.is_tensor(high):
-            high = tensor(high) if isinstance(high, _Iterable) else tensor(API.ones(shape) * high)
+            high = (
+                tensor(high)
+                if isinstance(high, _Iterable)
+                else tensor(API.full(shape, float(high), dtype=dtype))
+            )
         if not judo.is_tensor(low):
-            low = tensor(low) if isinstance(low, _Iterable) else tensor(API.ones(shape) * low)
+            low = (
+                tensor(low)
+                if isinstance(low, _Iterable)
+                else tensor(API.full(shape, float(low), dtype=dtype))
+            )
         self.high = judo.astype(high, dtype)
         self.low = judo.astype(low, dtype)
         self._bounds_dist = self.high - self.low
+        self._shape = tuple(self.high.shape)
+        self._len = int(self._shape[0]) if self._shape else 0
+        # Contiguous floating point versions of the bounds used in the hot path methods.
+        # They share memory with the original tensors when no conversion is needed.
+        float_dtype = judo.dtype.float
+        if isinstance(self.high, numpy.ndarray):
+            self._high_f = self.high.astype(float_dtype, order="C", copy=False)
+            self._low_f = self.low.astype(float_dtype, order="C", copy=False)
+            self._bounds_dist_f = self._bounds_dist.astype(float_dtype, order="C", copy=False)
+        else:
+            self._high_f = self.high.to(float_dtype).contiguous()
+            self._low_f = self.low.to(float_dtype).contiguous()
+            self._bounds_dist_f = self._bounds_dist.to(float_dtype).contiguous()
         if dtype is not None:
             self.dtype = dtype
         elif hasattr(high, "dtype"):
@@ -95,7 +134,7 @@ class Bounds:
 
     def __len__(self) -> int:
         """Return the number of dimensions of the bounds."""
-        return len(self.high)
+        return self._len
 
     def __contains__(self, item):
         return self.contains(item)
@@ -109,7 +148,7 @@ class Bounds:
             tuple containing the shape of `high` and `low`
 
         """
-        return self.high.shape
+        return self._shape
 
     @classmethod
     def from_tuples(cls, bounds: Iterable[tuple]) -> "Bounds":
@@ -128,15 +167,13 @@ class Bounds:
             >>> intervals = ((-1, 1), (-2, 1), (2, 3))
             >>> bounds = Bounds.from_tuples(intervals)
             >>> print(bounds)
-            Bounds shape int64 dtype (3,) low [-1 -2  2] high [1 1 3]
+            Bounds shape float32 dtype (3,) low [-1. -2.  2.] high [1. 1. 3.]
 
         """
-        low, high = [], []
-        for lo, hi in bounds:
-            low.append(lo)
-            high.append(hi)
-        low, high = tensor(low, dtype=dtype.float), tensor(high, dtype=dtype.float)
-        return Bounds(low=low, high=high)
+        intervals = list(bounds)
+        # Raises if any element is not a (low, high) pair, and keeps working for empty inputs
+        intervals = tensor(intervals, dtype=dtype.float).reshape(len(intervals), 2)
+        return Bounds(low=intervals[:, 0], high=intervals[:, 1])
 
     @classmethod
     def from_space(cls, space: "gym.spaces.box.Box") -> "Bounds":  # noqa: F821
@@ -169,16 +206,12 @@ class Bounds:
             :class:`Bounds` instance.
 
         """
-        pct = tensor(scale - 1)
-        big_scale = 1 + API.abs(pct)
-        small_scale = 1 - API.abs(pct)
-        zero = judo.astype(tensor(0.0), low.dtype)
-        if pct > 0:
-            xmin_scaled = API.where(low < zero, low * big_scale, low * small_scale)
-            xmax_scaled = API.where(high < zero, high * small_scale, high * big_scale)
-        else:
-            xmin_scaled = API.where(low < zero, low * small_scale, low * small_scale)
-            xmax_scaled = API.where(high < zero, high * big_scale, high * small_scale)
+        pct = float(scale) - 1.0
+        # Multiplying by grow moves a value away from zero when scale > 1 and towards
+        # zero when scale < 1. Multiplying by shrink does the opposite.
+        grow, shrink = 1.0 + pct, 1.0 - pct
+        xmin_scaled = API.where(low < 0, low * grow, low * shrink)
+        xmax_scaled = API.where(high < 0, high * shrink, high * grow)
         return xmin_scaled, xmax_scaled
 
     @classmethod
@@ -226,7 +259,11 @@ class Bounds:
             Clipped numpy array with all its values inside the defined bounds.
 
         """
-        return API.clip(judo.astype(x, dtype.float), self.low, self.high)
+        clipped = judo.astype(x, dtype.float)
+        # astype may return the input itself when it already has the target dtype,
+        # in which case clipping in place would modify the caller's data.
+        out = clipped if clipped is not x else None
+        return API.clip(clipped, self._low_f, self._high_f, out=out)
 
     def pbc(self, x: Tensor) -> Tensor:
         """
@@ -241,8 +278,11 @@ class Bounds:
 
         """
         x = judo.astype(x, dtype.float)
-        x = API.where(x < self.high, x, API.mod(x, self.high) + self.low)
-        x = API.where(x > self.low, x, self.high - API.mod(x, self.low))
+        if self._use_numba_kernel(x):
+            # astype returned a new array, so the kernel can write its output in place
+            return numba_kernels.pbc_kernel(x, self._low_f, self._high_f, x)
+        x = API.where(x < self._high_f, x, API.mod(x, self._high_f) + self._low_f)
+        x = API.where(x > self._low_f, x, self._high_f - API.mod(x, self._low_f))
         return x  # API.mod(, self.high)
 
     def pbc_distance(self, x: Tensor, y: Tensor) -> Tensor:
@@ -259,10 +299,23 @@ class Bounds:
 
         """
         x, y = judo.astype(x, dtype.float), judo.astype(y, dtype.float)
+        if self._use_numba_kernel(x) and x.shape == y.shape:
+            return numba_kernels.pbc_distance_kernel(x, y, self._bounds_dist_f, x)
         delta = judo.abs(x - y)
-        delta = API.where(x > 0.5 * self._bounds_dist, delta - self._bounds_dist, delta)
+        delta = API.where(x > 0.5 * self._bounds_dist_f, delta - self._bounds_dist_f, delta)
         return delta
 
+    def _use_numba_kernel(self, x: Tensor) -> bool:
+        """Return True if the numba kernels can process the rows of the target 2D array."""
+        return (
+            NUMBA_AVAILABLE is not False
+            and judo.Backend.is_numpy()
+            and len(x.shape) == 2
+            and len(self._low_f.shape) == 1
+            and x.shape[1] == self._low_f.shape[0]
+            and _load_numba_kernels()
+        )
+
     def contains(self, x: Tensor) -> Union[Tensor, bool]:
         """
         Check if the rows of the target array have all their coordinates inside \
@@ -277,9 +330,16 @@ class Bounds:
             Numpy array of booleans indicating if a row lies inside the bounds.
 
         """
-        match = self.clip(x) == judo.astype(x, dtype.float)
+        if self._use_numba_kernel(x):
+            x = x if x.dtype == self._low_f.dtype else judo.astype(x, dtype.float)
+            out = numpy.empty(x.shape[0], dtype=numpy.bool_)
+            return numba_kernels.contains_kernel(x, self._low_f, self._high_f, out)
+        x = judo.astype(x, dtype.float)
+        match = (x >= self._low_f) & (x <= self._high_f)
         return match.all(1).flatten() if len(match.shape) > 1 else match.all()
 
+    points_in_bounds = contains
+
     def safe_margin(
         self,
         low: Union[Tensor, Scalar] = None,
@@ -337,20 +397,3 @@ class Bounds:
 
         high = judo.to_numpy(self.high)
         return Box(low=judo.to_numpy(self.low), high=high, dtype=high.dtype)
-
-    def points_in_bounds(self, x: Tensor) -> Union[Tensor, bool]:
-        """
-        Check if the rows of the target array have all their coordinates inside \
-        specified bounds.
-
-        If the array is one dimensional it will return a boolean, otherwise a vector of booleans.
-
-        Args:
-            x: Array to be checked against the bounds.
-
-        Returns:
-            Numpy array of booleans indicating if a row lies inside the bounds.
-
-        """
-        match = self.clip(x) == judo.astype(x, dtype.float)
-        return match.all(1).flatten() if len(match.shape) > 1 else match.all()
@@ -85,7 +85,7 @@ class States:
         """
         attr_dict = self.params_to_arrays(state_dict, batch_size) if state_dict is not None else {}
         attr_dict.update(kwargs)
-        self._tensor_names = [k for k, v in attr_dict.items() if judo.is_tensor(v)]
+        self._tensor_names = frozenset(k for k, v in attr_dict.items() if judo.is_tensor(v))
         self._names = tuple(attr_dict.keys())
         self._attr_dict = attr_dict
         self.update(**self._attr_dict)
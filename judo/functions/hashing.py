@@ -1,4 +1,7 @@
-import uuid
+import itertools
+import os
+import pickle
+from typing import List
 
 import numpy
 import xxhash
@@ -7,7 +10,20 @@ import judo
 from judo.judo_backend import Backend
 
 
+def _new_id_counter() -> itertools.count:
+    """
+    Return a source of unique ids starting at a random 56 bits offset.
+
+    Ids are unique within a process. Different processes are unlikely to collide because \
+    each one starts at a different random offset, and all ids fit in int64 and uint64.
+
+    """
+    return itertools.count(int.from_bytes(os.urandom(7), "little"))
+
+
 class Hasher:
+    _id_counter = _new_id_counter()
+
     def __init__(self, seed: int = 0):
         self._seed = seed
 
@@ -16,27 +32,68 @@ class Hasher:
         return Backend.use_true_hash()
 
     @staticmethod
-    def hash_numpy(x: numpy.ndarray) -> int:
+    def as_buffer(x: numpy.ndarray):
+        """Return an object exposing the data of a non-object array through the buffer protocol."""
+        if x.flags.c_contiguous and x.dtype.kind not in "mM":
+            return x
+        # Non contiguous arrays and dtypes like datetime64 cannot export their buffer directly
+        return numpy.ascontiguousarray(x).reshape(-1).view(numpy.uint8)
+
+    @staticmethod
+    def object_to_bytes(obj) -> bytes:
+        """Return the pickled bytes of an object, or its python hash if it cannot be pickled."""
+        try:
+            return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return str(hash(obj)).encode()
+
+    @classmethod
+    def update_numpy(cls, xxh: xxhash.xxh3_64, x: numpy.ndarray) -> None:
+        """Feed the contents of a numpy array to the incremental hash state ``xxh``."""
+        if x.dtype == object:
+            # The buffer of an object array contains pointers, so hash the pickled elements
+            for obj in x.flat:
+                xxh.update(cls.object_to_bytes(obj))
+        else:
+            xxh.update(cls.as_buffer(x))
+
+    @classmethod
+    def hash_numpy(cls, x: numpy.ndarray) -> int:
         """Return a value that uniquely identifies a numpy array."""
-        # x = x.astype("|S576") if x.dtype == "O" else x
-        return int(xxhash.xxh64_intdigest(x.tobytes()))
+        kind = x.dtype.kind
+        if kind == "O":
+            xxh = xxhash.xxh3_64()
+            cls.update_numpy(xxh, x)
+            return xxh.intdigest()
+        # Hash the array data in place instead of the copy returned by tobytes
+        if x.flags.c_contiguous and kind not in "mM":
+            return xxhash.xxh3_64_intdigest(x)
+        return xxhash.xxh3_64_intdigest(cls.as_buffer(x))
+
+    @classmethod
+    def hash_torch(cls, x):
+        return cls.hash_numpy(judo.to_numpy(x))
 
     @staticmethod
-    def hash_torch(x):
-        bytes = judo.to_numpy(x).tobytes()
-        return int(hex(xxhash.xxh32_intdigest(bytes)))
+    def hash_numpy_rows(x: numpy.ndarray) -> List[int]:
+        """Return a list containing the hash of every element of the first dimension of x."""
+        if len(x) == 0:
+            return []
+        data = numpy.ascontiguousarray(x).reshape(len(x), -1).view(numpy.uint8)
+        return [xxhash.xxh3_64_intdigest(row) for row in data]
 
     @staticmethod
     def get_one_id():
-        return uuid.uuid1().int >> 64
+        return next(Hasher._id_counter)
+
+    @classmethod
+    def reset_id_counter(cls) -> None:
+        """Start generating ids from a new random offset."""
+        cls._id_counter = _new_id_counter()
 
     @classmethod
     def true_hash_tensor(cls, x):
-        funcs = {
-            "numpy": cls.hash_numpy,
-            # For now let's make hashers use numpy
-            "torch": lambda x: cls.hash_numpy(judo.to_numpy(x)),
-        }
+        funcs = {"numpy": cls.hash_numpy, "torch": cls.hash_torch}
         return Backend.execute(x, funcs)
 
     def hash_tensor(self, x):
@@ -46,7 +103,14 @@ class Hasher:
         return self.get_one_id()
 
     def hash_iterable(self, x):
-        hashes = [self.hash_tensor(xi) for xi in x]
+        if not self.uses_true_hash:
+            hashes = [self.get_one_id() for _ in x]
+        elif judo.is_tensor(x) and x.dtype != object and len(x.shape) > 0:
+            # Hash all the rows of the tensor at once instead of dispatching every element
+            hashes = self.hash_numpy_rows(judo.to_numpy(x))
+        else:
+            hash_func = self.hash_numpy if Backend.is_numpy() else self.hash_torch
+            hashes = [hash_func(xi if judo.is_tensor(xi) else judo.tensor([xi])) for xi in x]
         try:
             with judo.Backend.use_backend("numpy"):
                 return judo.as_tensor(hashes, dtype=judo.dtype.hash_type)
@@ -55,17 +119,23 @@ class Hasher:
             raise ValueError(f"Could not hash iterable {x} with dtype {x.dtype} because {e}.")
 
     def hash_state(self, state):
-        if self.uses_true_hash:
-            _hash = hash(
-                tuple(
-                    [
-                        self.hash_tensor(x) if k in state._tensor_names else hash(x)
-                        for k, x in state.items()
-                    ],
-                ),
-            )
-            return _hash
-        return self.get_one_id()
+        if not self.uses_true_hash:
+            return self.get_one_id()
+        tensor_names = state._tensor_names
+        # Allocating a new xxh3 state is cheaper than resetting a cached one
+        xxh = xxhash.xxh3_64()
+        for k, x in state.items():
+            xxh.update(k.encode())
+            if k in tensor_names:
+                self.update_numpy(xxh, judo.to_numpy(x))
+            else:
+                xxh.update(self.object_to_bytes(x))
+        return xxh.intdigest()
+
 
+# Forked processes inherit the counter state, so they need a new offset to avoid
+# generating the same ids as their parent.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=Hasher.reset_id_counter)
 
 hasher = Hasher()
@@ -0,0 +1,111 @@
+"""Numba compiled kernels used to speed up the numpy backend when numba is installed."""
+import numpy
+
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Leave the target function uncompiled when numba is not installed."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(parallel=True, cache=True)
+def contains_kernel(
+    x: numpy.ndarray,
+    low: numpy.ndarray,
+    high: numpy.ndarray,
+    out: numpy.ndarray,
+) -> numpy.ndarray:
+    """
+    Check if the rows of a 2D array have all their coordinates inside the interval [low, high].
+
+    Every row stops being checked as soon as one of its coordinates is found out of bounds.
+
+    Args:
+        x: Two dimensional array containing the points to be checked.
+        low: Lower bound for every coordinate of the points.
+        high: Higher bound for every coordinate of the points.
+        out: Boolean array of length ``x.shape[0]`` where the result will be written.
+
+    Returns:
+        The ``out`` array.
+
+    """
+    for i in prange(x.shape[0]):
+        ok = True
+        for j in range(x.shape[1]):
+            v = x[i, j]
+            if not (low[j] <= v <= high[j]):
+                ok = False
+                break
+        out[i] = ok
+    return out
+
+
+@njit(parallel=True, error_model="numpy", cache=True)
+def pbc_kernel(
+    x: numpy.ndarray,
+    low: numpy.ndarray,
+    high: numpy.ndarray,
+    out: numpy.ndarray,
+) -> numpy.ndarray:
+    """
+    Apply periodic boundary conditions to the coordinates of a 2D array in a single pass.
+
+    Args:
+        x: Two dimensional array containing the points to be wrapped.
+        low: Lower bound for every coordinate of the points.
+        high: Higher bound for every coordinate of the points.
+        out: Array with the same shape as ``x`` where the result will be written.
+
+    Returns:
+        The ``out`` array.
+
+    """
+    for i in prange(x.shape[0]):
+        for j in range(x.shape[1]):
+            v = x[i, j]
+            if not v < high[j]:
+                v = v % high[j] + low[j]
+            if not v > low[j]:
+                v = high[j] - v % low[j]
+            out[i, j] = v
+    return out
+
+
+@njit(parallel=True, cache=True)
+def pbc_distance_kernel(
+    x: numpy.ndarray,
+    y: numpy.ndarray,
+    bounds_dist: numpy.ndarray,
+    out: numpy.ndarray,
+) -> numpy.ndarray:
+    """
+    Calculate the distance between the coordinates of two 2D arrays under periodic boundary \
+    conditions in a single pass.
+
+    Args:
+        x: Two dimensional array containing the first set of points.
+        y: Array with the same shape as ``x`` containing the second set of points.
+        bounds_dist: Length of the bounded interval for every coordinate.
+        out: Array with the same shape as ``x`` where the result will be written.
+
+    Returns:
+        The ``out`` array.
+
+    """
+    for i in prange(x.shape[0]):
+        for j in range(x.shape[1]):
+            delta = abs(x[i, j] - y[i, j])
+            if x[i, j] > 0.5 * bounds_dist[j]:
+                delta = delta - bounds_dist[j]
+            out[i, j] = delta
+    return out
@@ -23,6 +23,7 @@ AVAILABLE_FUNCTIONS = [
     "ones",
     "zeros",
     "arange",
+    "full",
     "full_like",
     "allclose",
 ]
@@ -114,6 +115,10 @@ def allclose(*args, **kwargs):
     return numpy.allclose(*args, **kwargs)
 
 
+def full(*args, **kwargs):
+    return numpy.full(*args, **kwargs)
+
+
 def full_like(*args, **kwargs):
     return numpy.full_like(*args, **kwargs)
 
@@ -24,6 +24,7 @@ AVAILABLE_FUNCTIONS = [
     "ones",
     "zeros",
     "arange",
+    "full",
     "full_like",
     "allclose",
 ]
@@ -153,6 +154,10 @@ def allclose(*args, **kwargs):
     return torch.allclose(*args, **kwargs)
 
 
+def full(*args, **kwargs):
+    return torch.full(*args, **kwargs)
+
+
 def full_like(*args, **kwargs):
     return torch.full_like(*args, **kwargs)
 
@@ -19,6 +19,7 @@ extras = {
     "image": ["pillow>=7.0.0"],
     "ipython": ["ipython >= 7.0.0"],
     "data-structures": ["networkx > 2.0.0"],
+    "numba": ["numba>=0.50.0"],
 }
 
 # Meta dependency groups.
@@ -42,7 +43,7 @@ setup(
     install_requires=[
         "numpy>=1.0.0",
         "pyyaml>=5.0.0",
-        "xxhash>=1.1.0",
+        "xxhash>=2.0.0",
     ],
     package_data={"": ["README.md"], "judo": ["config.yml"]},
     classifiers=[
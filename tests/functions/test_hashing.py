@@ -0,0 +1,109 @@
+import os
+
+import numpy
+import pytest
+import xxhash
+
+from judo import Backend, States
+from judo.functions.hashing import Hasher
+
+
+class TestHasher:
+    def test_hash_numpy_object_array(self):
+        x = numpy.array([{"a": 1}, (1, 2), "text"], dtype=object)
+        y = numpy.array([{"a": 1}, (1, 2), "text"], dtype=object)
+        z = numpy.array([{"a": 2}, (1, 2), "text"], dtype=object)
+        assert Hasher.hash_numpy(x) == Hasher.hash_numpy(y)
+        assert Hasher.hash_numpy(x) != Hasher.hash_numpy(z)
+
+    def test_hash_numpy_matches_bytes(self):
+        x = numpy.arange(24, dtype=numpy.float32).reshape(2, 3, 4)
+        assert Hasher.hash_numpy(x) == xxhash.xxh3_64_intdigest(x.tobytes())
+        view = x[:, ::2]
+        assert Hasher.hash_numpy(view) == xxhash.xxh3_64_intdigest(view.tobytes())
+        scalar = numpy.array(3.0)
+        assert Hasher.hash_numpy(scalar) == xxhash.xxh3_64_intdigest(scalar.tobytes())
+        dates = numpy.array(["2020-01-01", "2021-01-01"], dtype="datetime64[D]")
+        assert Hasher.hash_numpy(dates) == xxhash.xxh3_64_intdigest(dates.tobytes())
+
+    def test_hash_iterable_true_hash(self):
+        hasher = Hasher()
+        # The backend context restores the previous true_hash value on exit
+        with Backend.use_backend(name="numpy"):
+            Backend.set_backend(true_hash=True)
+            x = numpy.arange(12, dtype=numpy.int64).reshape(4, 3)
+            x[2] = x[0]
+            hashes = hasher.hash_iterable(x)
+            assert hashes.tolist() == [hasher.hash_tensor(xi) for xi in x]
+            assert hashes[0] == hashes[2]
+            assert len(set(hashes.tolist())) == 3
+            vector = numpy.arange(5, dtype=numpy.float32)
+            hashes = hasher.hash_iterable(vector)
+            assert hashes.tolist() == [hasher.hash_tensor(xi) for xi in vector]
+            assert len(hasher.hash_iterable(numpy.zeros((0, 3)))) == 0
+
+    def test_get_one_id(self):
+        ids = [Hasher.get_one_id() for _ in range(100)]
+        assert len(set(ids)) == len(ids)
+        assert all(0 <= i < 2**63 for i in ids)
+
+    def test_hash_state_true_hash(self):
+        def new_states(value):
+            return States(batch_size=2, x=numpy.full((2, 3), value), name=[1, "a"], f=len)
+
+        with Backend.use_backend(name="numpy"):
+            Backend.set_backend(true_hash=True)
+            assert hash(new_states(1.0)) == hash(new_states(1.0))
+            assert hash(new_states(1.0)) != hash(new_states(2.0))
+
+    def test_hash_state_nested(self):
+        # The lambda cannot be pickled, so inner is hashed while outer is being hashed
+        inner = States(batch_size=2, x=numpy.ones((2, 3)), f=lambda x: x)
+        with Backend.use_backend(name="numpy"):
+            Backend.set_backend(true_hash=True)
+            outer_zeros = States(batch_size=2, x=numpy.zeros((2, 3)), inner=inner)
+            outer_ones = States(batch_size=2, x=numpy.ones((2, 3)), inner=inner)
+            assert hash(outer_zeros) == hash(outer_zeros)
+            assert hash(outer_zeros) != hash(outer_ones)
+
+    def test_hash_iterable_of_tensors(self):
+        hasher = Hasher()
+        x = [numpy.arange(3), numpy.arange(4), numpy.arange(3)]
+        with Backend.use_backend(name="numpy"):
+            Backend.set_backend(true_hash=True)
+            hashes = hasher.hash_iterable(x)
+            assert hashes.tolist() == [hasher.hash_tensor(xi) for xi in x]
+            assert hashes[0] == hashes[2]
+            assert hashes[0] != hashes[1]
+        with Backend.use_backend(name="numpy"):
+            Backend.set_backend(true_hash=False)
+            hashes = hasher.hash_iterable(x)
+            assert len(set(hashes.tolist())) == len(x)
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork is not available")
+    def test_get_one_id_forked_process(self):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # Child process
+            os.close(read_fd)
+            os.write(write_fd, str(Hasher.get_one_id()).encode())
+            os._exit(0)
+        os.close(write_fd)
+        parent_id = Hasher.get_one_id()
+        with os.fdopen(read_fd) as child_output:
+            child_id = int(child_output.read())
+        os.waitpid(pid, 0)
+        assert child_id != parent_id
+
+    def test_hash_numpy_unpicklable_object_array(self):
+        def func(x):
+            return x
+
+        x = numpy.array([lambda: 1, func, 3], dtype=object)
+        assert Hasher.hash_numpy(x) == Hasher.hash_numpy(x)
+        assert Hasher.hash_numpy(x) != Hasher.hash_numpy(x[::-1])
+        with Backend.use_backend(name="numpy"):
+            Backend.set_backend(true_hash=True)
+            states = States(batch_size=3, x=x)
+            assert hash(states) == hash(states)
+            assert len(Hasher().hash_iterable(x)) == 3
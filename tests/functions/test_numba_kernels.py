@@ -0,0 +1,43 @@
+import numpy
+import pytest
+
+from judo.functions.numba_kernels import contains_kernel, pbc_distance_kernel, pbc_kernel
+
+
+class TestNumbaKernels:
+    @pytest.mark.parametrize("dtype", [numpy.float32, numpy.float64])
+    def test_contains_kernel(self, dtype):
+        low = numpy.array([-1, -2, 0], dtype=dtype)
+        high = numpy.array([1, 2, 5], dtype=dtype)
+        x = numpy.array(
+            [[0, 0, 0], [-1, 2, 5], [1.5, 0, 0], [0, -3, 0], [0, 0, numpy.nan]],
+            dtype=dtype,
+        )
+        out = numpy.empty(x.shape[0], dtype=numpy.bool_)
+        res = contains_kernel(x, low, high, out)
+        target = ((x >= low) & (x <= high)).all(1)
+        assert res is out
+        assert (res == target).all()
+        assert res.tolist() == [True, True, False, False, False]
+
+    @pytest.mark.parametrize("dtype", [numpy.float32, numpy.float64])
+    def test_pbc_kernel(self, dtype):
+        rng = numpy.random.default_rng(160290)
+        low = numpy.array([-1, -2, 0.5], dtype=dtype)
+        high = numpy.array([1, 2, 5], dtype=dtype)
+        x = rng.uniform(-10, 10, size=(50, 3)).astype(dtype)
+        target = numpy.where(x < high, x, numpy.mod(x, high) + low)
+        target = numpy.where(target > low, target, high - numpy.mod(target, low))
+        res = pbc_kernel(x, low, high, numpy.empty_like(x))
+        assert numpy.allclose(res, target, atol=1e-5)
+
+    @pytest.mark.parametrize("dtype", [numpy.float32, numpy.float64])
+    def test_pbc_distance_kernel(self, dtype):
+        rng = numpy.random.default_rng(160290)
+        bounds_dist = numpy.array([2, 4, 4.5], dtype=dtype)
+        x = rng.uniform(-5, 5, size=(50, 3)).astype(dtype)
+        y = rng.uniform(-5, 5, size=(50, 3)).astype(dtype)
+        delta = numpy.abs(x - y)
+        target = numpy.where(x > 0.5 * bounds_dist, delta - bounds_dist, delta)
+        res = pbc_distance_kernel(x, y, bounds_dist, numpy.empty_like(x))
+        assert numpy.allclose(res, target, atol=1e-5)
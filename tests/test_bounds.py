@@ -2,6 +2,7 @@ import pytest
 
 import judo
 from judo import dtype, tensor
+from judo.data_structures import bounds as bounds_module
 from judo.data_structures.bounds import Bounds
 from judo.functions.api import API
 
@@ -43,6 +44,7 @@ class TestBounds:
         shape = bounds_fixture.shape
         assert isinstance(shape, tuple)
         assert shape == (3,)
+        assert len(bounds_fixture) == 3
 
     def test_points_in_bounds(self, bounds_fixture):
         points = tensor([[0, 0, 0], [11, 0, 0], [0, 11, 0], [11, 11, 11]])
@@ -50,11 +52,60 @@ class TestBounds:
         for a, b in zip(res.tolist(), [True, False, False, False]):
             assert a == b
 
+    @pytest.mark.parametrize("numba_available", [True, False])
+    def test_contains_backends(self, bounds_fixture, numba_available, monkeypatch):
+        if not numba_available:
+            monkeypatch.setattr(bounds_module, "NUMBA_AVAILABLE", False)
+        points = tensor([[0, 0, 0], [11, 0, 0], [0, 11, 0], [-4, 1, 4.5]], dtype=dtype.float)
+        res = bounds_fixture.contains(points)
+        assert res.tolist()[:3] == [True, False, False]
+        assert bool(bounds_fixture.contains(points[0])) is True
+
+    @pytest.mark.parametrize("width", [2, 4])
+    def test_contains_mismatched_width(self, bounds_fixture, width):
+        with pytest.raises((ValueError, RuntimeError)):
+            bounds_fixture.contains(API.zeros((2, width)))
+
+    @pytest.mark.parametrize("numba_available", [True, False])
+    def test_pbc(self, numba_available, monkeypatch):
+        if not numba_available:
+            monkeypatch.setattr(bounds_module, "NUMBA_AVAILABLE", False)
+        bounds = Bounds(high=tensor([1, 2, 3], dtype=dtype.float), low=0.5)
+        x = tensor([[0.75, 1.5, 2.5], [1.5, 2.5, 0.25]], dtype=dtype.float)
+        target = tensor([[0.75, 1.5, 2.5], [1.0, 1.0, 2.75]], dtype=dtype.float)
+        assert API.allclose(bounds.pbc(x), target)
+        y = tensor([[0.5, 0.5, 0.5], [0.5, 0.5, 0.5]], dtype=dtype.float)
+        target = tensor([[-0.25, -0.5, -0.5], [0.5, 0.5, 0.25]], dtype=dtype.float)
+        assert API.allclose(bounds.pbc_distance(x, y), target)
+
+    def test_pbc_2d_bounds(self):
+        bounds = Bounds(high=API.ones((2, 3)), low=-API.ones((2, 3)))
+        x = API.full((2, 3), 5.0)
+        assert API.allclose(bounds.pbc(x), API.ones((2, 3)))
+        assert API.allclose(bounds.pbc_distance(x, API.zeros((2, 3))), API.full((2, 3), 3.0))
+
+    @pytest.mark.parametrize("width", [2, 4])
+    def test_pbc_mismatched_width(self, bounds_fixture, width):
+        with pytest.raises((ValueError, RuntimeError)):
+            bounds_fixture.pbc(API.zeros((2, width)))
+        with pytest.raises((ValueError, RuntimeError)):
+            bounds_fixture.pbc_distance(API.zeros((2, width)), API.zeros((2, width)))
+
     def test_from_tuples(self):
         tup = ((-1, 2), (-3, 4), (2, 5))
         bounds = Bounds.from_tuples(tup)
         assert (bounds.low == tensor([-1, -3, 2])).all()
         assert (bounds.high == tensor([2, 4, 5])).all()
+        empty = Bounds.from_tuples([])
+        assert empty.shape == (0,)
+        assert len(empty) == 0
+
+    @pytest.mark.parametrize(
+        "intervals", [((1, 2, 3), (4, 5, 6)), (1, 2, 3, 4), ((1, 2, 3, 4),), ((1, 2), (3,))]
+    )
+    def test_from_tuples_malformed(self, intervals):
+        with pytest.raises((ValueError, TypeError, RuntimeError)):
+            Bounds.from_tuples(intervals)
 
     def test_from_array(self):
         array = tensor([[0, 0, 0], [11, 0, 0], [0, 11, 0], [11, 11, 11]])
@@ -125,7 +176,7 @@ class TestBounds:
             [[10, 10, 10], [100, 10, 10], [10, 100, 10], [100, 100, 100]], dtype=dtype.float
         )
         bounds = Bounds.from_array(array, scale=0.9)
-        assert API.allclose(bounds.low, tensor([9.0, 9.0, 9.0], dtype=dtype.float)), (
+        assert API.allclose(bounds.low, tensor([11.0, 11.0, 11.0], dtype=dtype.float)), (
             bounds.low,
             array.min(axis=0),
         )
@@ -174,6 +225,8 @@ class TestBounds:
             [[-1.0, 0.0, 2.0], [10.0, 0.0, 2.0], [0.0, 4.0, 2], [10, 4, 5]], dtype=dtype.float
         )
         assert API.allclose(clipped, target), (clipped.dtype, target.dtype)
+        # Clipping must not modify the input in place
+        assert array[0, 0] == -10
 
     @pytest.mark.parametrize("bounds_fixture", bounds_fixture_params, indirect=True)
     def test_to_tuples(self, bounds_fixture):